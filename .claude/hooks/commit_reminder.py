@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.8"
-# dependencies = ["GitPython>=3.1.40"]
+# dependencies = ["orjson"]
 # ///
 
 """
@@ -10,7 +10,7 @@ Commit Reminder Hook - Industry Standard Practices
 This hook implements industry-standard git commit reminders:
 1. Reminds to commit after completing discrete tasks
 2. Time-based reminders (every 30 minutes of active work)
-3. Tracks file changes and suggests commits when significant work is done
+3. Tracks file changes and lists them in each reminder
 4. Follows conventional commit standards
 5. Prevents work loss by encouraging regular commits
 
@@ -22,48 +22,224 @@ Industry Standards Implemented:
 - Branch protection through frequent commits
 """
 
+import atexit
 import json
 import os
+import shutil
+import subprocess
 import sys
 import time
-from datetime import datetime, timedelta
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# All git access goes through the git CLI
+GIT_AVAILABLE = shutil.which('git') is not None
+
 try:
-    import git
-    GIT_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    GIT_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False  # Windows: writes stay atomic but are not serialized
 
 # Configuration - Industry standard intervals
 COMMIT_REMINDER_INTERVAL_MINUTES = 30  # Remind every 30 minutes
 TASK_COMPLETION_REMINDER = True        # Remind after task completion
+TASK_TOOLS = frozenset({'Write', 'Edit', 'MultiEdit', 'TodoWrite'})  # Tools that count as task completion
 SIGNIFICANT_CHANGES_THRESHOLD = 5      # Lines changed to trigger reminder
-MAX_FILES_CHANGED_BEFORE_REMINDER = 3 # Files changed threshold
+LARGE_REPO_INDEX_SIZE = 100_000        # Tracked files above which only dirtiness is checked
+MIN_HOOK_INPUT_BYTES = 8               # Smaller stdin payloads carry no tool call
+
+# Cheapest status invocation: no index refresh lock, no upstream counting,
+# no submodule recursion. Untracked directories are collapsed (e.g. `build/`),
+# so the list stays bounded by directory fan-out rather than file count.
+GIT_STATUS_COMMAND = [
+    'git', '--no-optional-locks', 'status', '--porcelain=v1', '-z',
+    '--no-ahead-behind', '--ignore-submodules', '--untracked-files=normal'
+]
+
+# Industry standard recommendations appended to every reminder
+RECOMMENDATIONS_TEXT = "\n".join([
+    "",
+    "📋 **Industry Standard Recommendations:**",
+    "• Commit early and often to prevent work loss",
+    "• Use atomic commits (one logical change per commit)",
+    "• Write clear, descriptive commit messages",
+    "• Consider using conventional commit format: `type(scope): description`",
+    "",
+    "🏷️ **Common commit types:** feat, fix, docs, style, refactor, test, chore",
+    "",
+    "💡 **Example good commit message:**",
+    "`feat(auction): add Hebrew calendar integration for auction scheduling`",
+    "",
+    "⚡ **Quick commit commands:**",
+    "```bash",
+    "git add -A && git commit -m \"your message here\"",
+    "# or for conventional commits:",
+    "git add -A && git commit -m \"feat: your feature description\"",
+    "```"
+])
+
+# Logging - append-only JSON Lines, trimmed only once the file grows large
+LOG_MAX_ENTRIES = 100                  # Entries kept after a trim
+LOG_TRIM_THRESHOLD_BYTES = 1024 * 1024 # File size that triggers a trim
+LOG_TRIM_TARGET_BYTES = LOG_TRIM_THRESHOLD_BYTES // 2  # Max size kept after a trim
+LOG_TAIL_BLOCK_BYTES = 8192            # Chunk size when reading a log backwards
+LOG_FILE_NAME = 'commit_reminder.jsonl' # Hook execution history
+ERROR_LOG_FILE_NAME = 'hook_errors.jsonl'  # Errors raised by the hook
+
+def get_log_dir() -> Path:
+    """Return the hook log directory, creating it if needed."""
+    log_dir = Path.cwd() / 'logs'
+    log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
+
+@contextmanager
+def file_lock(lock_file: Path):
+    """Hold an exclusive lock on a sidecar file so concurrent hooks don't race."""
+    if not FCNTL_AVAILABLE:
+        yield
+        return
+    
+    with open(lock_file, 'w') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def atomic_write(path: Path, content: bytes):
+    """Replace a file's content via a temp file so readers never see a partial write."""
+    tmp_file = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_file, path)
+
+def read_log_tail(log_file: Path, max_entries: int) -> List[bytes]:
+    """Read the last entries of a JSON Lines log by seeking backwards from the end."""
+    blocks = []
+    newlines = 0
+    with open(log_file, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        
+        # One extra newline guarantees the oldest kept entry is complete
+        while position > 0 and newlines <= max_entries:
+            read_size = min(LOG_TAIL_BLOCK_BYTES, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size)
+            blocks.append(block)
+            newlines += block.count(b'\n')
+    
+    data = b''.join(reversed(blocks))
+    return list(deque(data.splitlines(keepends=True), maxlen=max_entries))
+
+def encode_log_entry(entry: Dict) -> bytes:
+    """Encode one log entry as a compact JSON line, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(entry) + b'\n'
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, which json handles
+    return json.dumps(entry, separators=(',', ':')).encode('utf-8') + b'\n'
+
+def append_log_entry(log_file: Path, entry: Dict):
+    """Append one entry to a JSON Lines log, trimming it when it gets large."""
+    with file_lock(log_file.with_name(log_file.name + '.lock')):
+        with open(log_file, 'ab') as f:
+            f.write(encode_log_entry(entry))
+        
+        # Cheap stat on the hot path; only rewrite once the size threshold is hit
+        if log_file.stat().st_size <= LOG_TRIM_THRESHOLD_BYTES:
+            return
+        
+        # Trim well below the threshold so large entries (Write payloads carry
+        # file contents) can't make every following append trim again
+        lines = deque(read_log_tail(log_file, LOG_MAX_ENTRIES))
+        kept_bytes = sum(len(line) for line in lines)
+        while len(lines) > 1 and kept_bytes > LOG_TRIM_TARGET_BYTES:
+            kept_bytes -= len(lines.popleft())
+        
+        atomic_write(log_file, b''.join(lines))
+
 
 class CommitReminder:
     def __init__(self):
-        self.log_dir = Path.cwd() / 'logs'
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.log_dir = get_log_dir()
         self.state_file = self.log_dir / 'commit_reminder_state.json'
+        self.state_lock_file = self.log_dir / 'commit_reminder_state.json.lock'
+        self.log_file = self.log_dir / LOG_FILE_NAME
+        self.error_log_file = self.log_dir / ERROR_LOG_FILE_NAME
+        self._work_tree = None
+        
+        # Hold the state lock from load to save so concurrent hooks can't
+        # overwrite each other's counter updates
+        self._state_lock = None
+        self._lock_state()
         self.load_state()
         
+        # Safety net in case the hook exits before main() saves the state
+        atexit.register(self.save_state)
+    
+    def _lock_state(self):
+        """Take the exclusive state lock (a no-op where fcntl is unavailable)."""
+        if not FCNTL_AVAILABLE:
+            return
+        
+        self._state_lock = open(self.state_lock_file, 'w')
+        fcntl.flock(self._state_lock, fcntl.LOCK_EX)
+    
+    def _unlock_state(self):
+        """Release the state lock taken in __init__."""
+        if self._state_lock is None:
+            return
+        
+        fcntl.flock(self._state_lock, fcntl.LOCK_UN)
+        self._state_lock.close()
+        self._state_lock = None
+        
     def load_state(self):
         """Load the current state from disk."""
+        self._dirty = False
+        self._saved_state = None
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r') as f:
                     self.state = json.load(f)
+                self._saved_state = self._serialize_state()
             except (json.JSONDecodeError, FileNotFoundError):
                 self.state = self._default_state()
         else:
             self.state = self._default_state()
     
+    def _serialize_state(self) -> str:
+        """Serialize the state compactly."""
+        return json.dumps(self.state, separators=(',', ':'))
+    
     def save_state(self):
-        """Save the current state to disk."""
-        with open(self.state_file, 'w') as f:
-            json.dump(self.state, f, indent=2)
+        """Save the current state to disk, skipping the write if unchanged.
+        
+        Mutators only mark the state dirty; main() saves once per invocation
+        and this releases the state lock held since the state was loaded.
+        """
+        try:
+            if not self._dirty:
+                return
+            
+            serialized = self._serialize_state()
+            if serialized != self._saved_state:
+                atomic_write(self.state_file, serialized.encode('utf-8'))
+                self._saved_state = serialized
+            self._dirty = False
+        finally:
+            self._unlock_state()
     
     def _default_state(self) -> Dict:
         """Return default state structure."""
@@ -77,67 +253,159 @@ class CommitReminder:
             'reminders_sent': 0
         }
     
+    def _get_work_tree(self) -> Optional[str]:
+        """Return the top-level directory of the current repository."""
+        if self._work_tree is None:
+            result = subprocess.run(
+                ['git', 'rev-parse', '--show-toplevel'],
+                capture_output=True,
+                text=True
+            )
+            if result.returncode != 0:
+                return None  # Not inside a git repository
+            
+            self._work_tree = result.stdout.strip()
+        return self._work_tree
+    
+    def _parse_porcelain_status(self, output: str) -> Dict[str, List[str]]:
+        """Split `git status --porcelain=v1 -z` output into file lists."""
+        changed_files = []
+        staged_files = []
+        untracked_files = []
+        
+        entries = iter(output.split('\0'))
+        for entry in entries:
+            if len(entry) < 4:
+                continue
+            
+            index_state, worktree_state, path = entry[0], entry[1], entry[3:]
+            if index_state in 'RC' or worktree_state in 'RC':
+                next(entries, None)  # Skip the rename/copy source path
+            
+            if index_state == '?':
+                untracked_files.append(path)
+                continue
+            if index_state not in ' !':
+                staged_files.append(path)
+            if worktree_state not in ' !':
+                changed_files.append(path)
+        
+        return {
+            'changed_files': changed_files,
+            'staged_files': staged_files,
+            'untracked_files': untracked_files
+        }
+    
+    def _tracked_files_clean(self, cwd: str) -> bool:
+        """Check tracked files against HEAD, stopping at the first difference."""
+        # Unlike diff-index, diff refreshes stat info in memory, so files that
+        # were only touched (checkout, editor save) don't count as changed
+        result = subprocess.run(
+            ['git', '--no-optional-locks', 'diff', '--quiet', 'HEAD', '--ignore-submodules'],
+            cwd=cwd,
+            capture_output=True
+        )
+        return result.returncode == 0
+    
+    def _spawn_untracked_listing(self, cwd: str) -> subprocess.Popen:
+        """Start listing untracked files; the caller reads as much as it needs."""
+        return subprocess.Popen(
+            ['git', '--no-optional-locks', 'ls-files', '--others', '--exclude-standard', '-z'],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+    
+    def _is_large_repo(self, cwd: str) -> bool:
+        """Check whether the index is too large for a full status listing.
+        
+        The tracked file count is computed once and remembered in the state.
+        """
+        if self.state.get('index_size') is None:
+            output = subprocess.check_output(
+                ['git', '--no-optional-locks', 'ls-files', '-z'],
+                cwd=cwd,
+                stderr=subprocess.DEVNULL
+            )
+            self.state['index_size'] = output.count(b'\0')
+            self._dirty = True
+        
+        return self.state['index_size'] > LARGE_REPO_INDEX_SIZE
+    
+    def _is_worktree_clean(self, cwd: str) -> bool:
+        """Cheap early-exit probe: True only if nothing needs listing."""
+        # The untracked walk runs alongside the tracked diff. A dirty diff
+        # kills it, and a single byte of output is enough to know untracked
+        # files exist.
+        untracked = self._spawn_untracked_listing(cwd)
+        try:
+            return self._tracked_files_clean(cwd) and not untracked.stdout.read(1)
+        finally:
+            untracked.stdout.close()
+            untracked.kill()
+            untracked.wait()
+    
     def get_git_status(self) -> Optional[Dict]:
         """Get current git repository status."""
         if not GIT_AVAILABLE:
             return None
-            
+        
         try:
-            repo = git.Repo(Path.cwd())
-            
-            # Get changed files
-            changed_files = []
-            staged_files = []
-            untracked_files = []
+            work_tree = self._get_work_tree()
+            if work_tree is None:
+                return None
             
-            # Check for changes
-            if repo.is_dirty():
-                changed_files = [item.a_path for item in repo.index.diff(None)]
-                staged_files = [item.a_path for item in repo.index.diff("HEAD")]
-            
-            untracked_files = repo.untracked_files
+            large_repo = self._is_large_repo(work_tree)
+            if large_repo:
+                # Too big to list changes cheaply; only record whether tracked
+                # content differs from HEAD. Touched but identical files don't
+                # count, so checkouts and editor saves don't trigger a reminder.
+                is_clean = self._tracked_files_clean(work_tree)
+            else:
+                is_clean = self._is_worktree_clean(work_tree)
             
-            # Get last commit time
-            try:
-                last_commit = repo.head.commit
-                last_commit_time = last_commit.committed_date
-            except:
-                last_commit_time = None
+            if is_clean or large_repo:
+                changed_files = []
+                staged_files = []
+                untracked_files = []
+            else:
+                # Only a dirty tree pays for the full porcelain status listing
+                result = subprocess.run(
+                    GIT_STATUS_COMMAND,
+                    cwd=work_tree,
+                    capture_output=True,
+                    text=True
+                )
+                if result.returncode != 0:
+                    return None
+                
+                files = self._parse_porcelain_status(result.stdout)
+                changed_files = files['changed_files']
+                staged_files = files['staged_files']
+                untracked_files = files['untracked_files']
             
+            total_changes = len(changed_files) + len(staged_files) + len(untracked_files)
             return {
                 'changed_files': changed_files,
                 'staged_files': staged_files,
                 'untracked_files': untracked_files,
-                'total_changes': len(changed_files) + len(staged_files) + len(untracked_files),
-                'last_commit_time': last_commit_time,
-                'has_changes': len(changed_files) > 0 or len(staged_files) > 0 or len(untracked_files) > 0
+                'total_changes': total_changes,
+                'has_changes': not is_clean if large_repo else total_changes > 0,
+                'large_repo': large_repo
             }
-        except git.exc.InvalidGitRepositoryError:
-            return None
         except Exception:
             return None
     
     def should_remind_time_based(self) -> bool:
         """Check if enough time has passed for a time-based reminder."""
-        if not self.state['last_commit_reminder']:
-            return True
-            
-        last_reminder = datetime.fromtimestamp(self.state['last_commit_reminder'])
-        time_since_reminder = datetime.now() - last_reminder
-        
-        return time_since_reminder >= timedelta(minutes=COMMIT_REMINDER_INTERVAL_MINUTES)
+        # A missing timestamp counts as epoch, so the first check always reminds
+        time_since_reminder = time.time() - (self.state['last_commit_reminder'] or 0)
+        return time_since_reminder >= COMMIT_REMINDER_INTERVAL_MINUTES * 60
     
     def should_remind_task_based(self) -> bool:
         """Check if we should remind based on task completion."""
         return TASK_COMPLETION_REMINDER and self.state['tasks_completed'] > 0
     
-    def should_remind_changes_based(self, git_status: Dict) -> bool:
-        """Check if we should remind based on file changes."""
-        if not git_status or not git_status['has_changes']:
-            return False
-            
-        return (git_status['total_changes'] >= MAX_FILES_CHANGED_BEFORE_REMINDER)
-    
     def generate_reminder_message(self, git_status: Dict = None) -> str:
         """Generate an appropriate reminder message."""
         messages = []
@@ -150,83 +418,88 @@ class CommitReminder:
         # Changes-based reminder
         if git_status and git_status['has_changes']:
             total_changes = git_status['total_changes']
-            messages.append(f"📝 **{total_changes} files have changes** that should be committed.")
+            if total_changes:
+                messages.append(f"📝 **{total_changes} files have changes** that should be committed.")
+            else:
+                messages.append("📝 **Uncommitted changes** should be committed.")
             
             if git_status['changed_files']:
                 messages.append(f"   Modified: {', '.join(git_status['changed_files'][:3])}")
-            if git_status['untracked_files']:
-                messages.append(f"   New files: {', '.join(git_status['untracked_files'][:3])}")
-        
-        # Industry standard recommendations
-        recommendations = [
-            "",
-            "📋 **Industry Standard Recommendations:**",
-            "• Commit early and often to prevent work loss",
-            "• Use atomic commits (one logical change per commit)",
-            "• Write clear, descriptive commit messages",
-            "• Consider using conventional commit format: `type(scope): description`",
-            "",
-            "🏷️ **Common commit types:** feat, fix, docs, style, refactor, test, chore",
-            "",
-            "💡 **Example good commit message:**",
-            "`feat(auction): add Hebrew calendar integration for auction scheduling`",
-            "",
-            "⚡ **Quick commit commands:**",
-            "```bash",
-            "git add -A && git commit -m \"your message here\"",
-            "# or for conventional commits:",
-            "git add -A && git commit -m \"feat: your feature description\"",
-            "```"
-        ]
+            untracked_files = git_status['untracked_files']
+            if untracked_files:
+                more = f" (+{len(untracked_files) - 3} more)" if len(untracked_files) > 3 else ""
+                messages.append(f"   New files: {', '.join(untracked_files[:3])}{more}")
         
-        return "\n".join(messages + recommendations)
+        messages.append(RECOMMENDATIONS_TEXT)
+        return "\n".join(messages)
     
     def update_task_completion(self):
         """Update task completion counter."""
         self.state['tasks_completed'] += 1
-        self.save_state()
+        self._dirty = True
     
     def reset_after_reminder(self):
         """Reset state after sending a reminder."""
         self.state['last_commit_reminder'] = time.time()
         self.state['reminders_sent'] += 1
         self.state['tasks_completed'] = 0  # Reset task counter
-        self.save_state()
+        self._dirty = True
     
     def process_hook_data(self, hook_data: Dict) -> Optional[str]:
         """Process hook data and determine if a reminder should be sent."""
-        git_status = self.get_git_status()
-        
-        # Determine if we should send a reminder
+        # Determine if we should send a reminder; git is only consulted once
+        # a time or task trigger is due, since a reminder needs changes anyway
         should_remind = (
             self.should_remind_time_based() or
-            self.should_remind_task_based() or
-            (git_status and self.should_remind_changes_based(git_status))
+            self.should_remind_task_based()
         )
+        git_status = self.get_git_status() if should_remind else None
         
-        if should_remind and git_status and git_status['has_changes']:
+        if git_status and git_status['has_changes']:
             reminder_message = self.generate_reminder_message(git_status)
             self.reset_after_reminder()
             return reminder_message
         
         # Update task completion if this appears to be a task completion
         tool_name = hook_data.get('tool_name', '')
-        if tool_name in ['Write', 'Edit', 'MultiEdit', 'TodoWrite']:
+        if tool_name in TASK_TOOLS:
             self.update_task_completion()
         
         return None
 
+_commit_reminder = None
+
+def get_commit_reminder() -> CommitReminder:
+    """Return the process-wide CommitReminder, creating it on first use."""
+    global _commit_reminder
+    if _commit_reminder is None:
+        _commit_reminder = CommitReminder()
+    return _commit_reminder
+
 def main():
     """Main hook execution function."""
     try:
         # Read hook data from stdin
-        hook_data = json.load(sys.stdin)
+        raw = sys.stdin.buffer.read()
+        
+        # Nothing to act on: log the call and skip git and state entirely
+        if len(raw) < MIN_HOOK_INPUT_BYTES:
+            append_log_entry(get_log_dir() / LOG_FILE_NAME, {
+                'timestamp': time.time(),
+                'hook_data': None,
+                'reminder_sent': False,
+                'git_available': GIT_AVAILABLE
+            })
+            sys.exit(0)
+        
+        hook_data = json.loads(raw)
         
         # Initialize commit reminder
-        reminder = CommitReminder()
+        reminder = get_commit_reminder()
         
         # Process the hook data
         reminder_message = reminder.process_hook_data(hook_data)
+        reminder.save_state()
         
         # If we have a reminder message, output it
         if reminder_message:
@@ -240,24 +513,7 @@ def main():
             'git_available': GIT_AVAILABLE
         }
         
-        log_file = Path.cwd() / 'logs' / 'commit_reminder.json'
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except:
-                    log_data = []
-        else:
-            log_data = []
-        
-        log_data.append(log_entry)
-        
-        # Keep only last 100 entries
-        if len(log_data) > 100:
-            log_data = log_data[-100:]
-            
-        with open(log_file, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        append_log_entry(reminder.log_file, log_entry)
         
         sys.exit(0)
         
@@ -270,16 +526,12 @@ def main():
         }
         
         try:
-            error_file = Path.cwd() / 'logs' / 'hook_errors.json'
-            if error_file.exists():
-                with open(error_file, 'r') as f:
-                    errors = json.load(f)
+            # Reuse the reminder's paths unless the failure happened before it existed
+            if _commit_reminder is not None:
+                error_file = _commit_reminder.error_log_file
             else:
-                errors = []
-            
-            errors.append(error_log)
-            with open(error_file, 'w') as f:
-                json.dump(errors, f, indent=2)
+                error_file = get_log_dir() / ERROR_LOG_FILE_NAME
+            append_log_entry(error_file, error_log)
         except:
             pass
         
@@ -0,0 +1,108 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8"
+# dependencies = [
+#     "pyttsx3",
+# ]
+# ///
+
+import os
+import socket
+import sys
+from pathlib import Path
+
+# Unix domain socket the speaker daemon listens on
+SOCKET_PATH = Path.home() / ".cache" / "claude" / "tts.sock"
+
+# Held for the daemon's lifetime so only one daemon owns the socket
+LOCK_PATH = SOCKET_PATH.with_name("tts.lock")
+
+# Exit after this long without a request so the daemon doesn't linger
+IDLE_TIMEOUT_SECONDS = 600
+
+
+def create_engine():
+    """Initialize a pyttsx3 engine with the hook's voice settings."""
+    import pyttsx3
+
+    engine = pyttsx3.init()
+    engine.setProperty('rate', 180)    # Speech rate (words per minute)
+    engine.setProperty('volume', 0.8)  # Volume (0.0 to 1.0)
+    return engine
+
+
+def read_lines(connection):
+    """Yield newline-delimited messages from a client connection."""
+    buffer = b""
+    while True:
+        chunk = connection.recv(4096)
+        if not chunk:
+            break
+        buffer += chunk
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            yield line.decode("utf-8", errors="replace")
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace")
+
+
+def main():
+    """
+    pyttsx3 Speaker Daemon
+
+    Keeps a single pyttsx3 engine alive and speaks newline-delimited text
+    received on a Unix domain socket, so each pyttsx3_tts.py call skips
+    interpreter startup and engine initialization.
+
+    Usage:
+    - ./pyttsx3_daemon.py   # Normally spawned by pyttsx3_tts.py on demand
+    """
+
+    import fcntl  # POSIX only; the client imports this module on every platform
+
+    SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    lock_file = open(LOCK_PATH, "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        sys.exit(0)  # Another daemon is running or starting up
+
+    # With the lock held, any existing socket was left by a daemon that died
+    if SOCKET_PATH.exists():
+        SOCKET_PATH.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    bound = False
+    try:
+        # Listen before the slow engine init; clients queue in the backlog
+        server.bind(str(SOCKET_PATH))
+        bound = True
+        server.listen()
+        server.settimeout(IDLE_TIMEOUT_SECONDS)
+
+        engine = create_engine()
+
+        while True:
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                break
+
+            with connection:
+                connection.settimeout(None)
+                for text in read_lines(connection):
+                    if text.strip():
+                        engine.say(text)
+                engine.runAndWait()
+    finally:
+        server.close()
+        if bound:
+            try:
+                os.unlink(SOCKET_PATH)
+            except OSError:
+                pass
+        lock_file.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,86 @@
 # ]
 # ///
 
-import sys
+import os
 import random
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from pyttsx3_daemon import SOCKET_PATH, create_engine
+
+# Default completion messages
+COMPLETION_MESSAGES = (
+    "Work complete!",
+    "All done!",
+    "Task finished!",
+    "Job complete!",
+    "Ready for next task!"
+)
+
+# How long to wait for a freshly spawned daemon to start listening
+DAEMON_STARTUP_TIMEOUT_SECONDS = 5
+
+
+def audio_available():
+    """Cheaply guess whether this environment can play audio.
+
+    Only Linux is probed: headless containers and CI have no sound device,
+    and there pyttsx3 import + init is slow and always fails.
+    """
+    if not sys.platform.startswith("linux"):
+        return True
+
+    return bool(os.environ.get("PULSE_SERVER") or os.path.exists("/dev/snd")
+                or os.environ.get("WSL_DISTRO_NAME"))
+
+
+def send_to_daemon(text):
+    """Send text to the speaker daemon. Returns False if it isn't reachable."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(SOCKET_PATH))
+        except OSError:
+            return False
+        client.sendall(text.encode("utf-8") + b"\n")
+        return True
+
+
+def spawn_daemon():
+    """Start the speaker daemon detached from this process."""
+    daemon_script = Path(__file__).parent / "pyttsx3_daemon.py"
+    return subprocess.Popen(
+        [sys.executable, str(daemon_script)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def speak_via_daemon(text):
+    """Speak through the daemon, spawning it if needed."""
+    if not hasattr(socket, "AF_UNIX"):
+        return False  # No Unix domain sockets on this platform
+
+    if send_to_daemon(text):
+        return True
+
+    daemon = spawn_daemon()
+    deadline = time.monotonic() + DAEMON_STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        if send_to_daemon(text):
+            return True
+        
+        # The daemon exited before listening (e.g. pyttsx3 failed to init),
+        # or another daemon already owned the socket and this one quit
+        if daemon.poll() is not None:
+            return send_to_daemon(text)
+    return False
+
 
 def main():
     """
@@ -24,19 +102,14 @@ def main():
     - Offline TTS (no API key required)
     - Cross-platform compatibility
     - Configurable voice settings
-    - Immediate audio playback
+    - Speaker daemon keeps the engine initialized between calls
     """
     
+    if not audio_available():
+        print("⚠️  Audio not available, skipping TTS")
+        sys.exit(0)
+    
     try:
-        import pyttsx3
-        
-        # Initialize TTS engine
-        engine = pyttsx3.init()
-        
-        # Configure engine settings
-        engine.setProperty('rate', 180)    # Speech rate (words per minute)
-        engine.setProperty('volume', 0.8)  # Volume (0.0 to 1.0)
-        
         print("🎙️  pyttsx3 TTS")
         print("=" * 15)
         
@@ -44,20 +117,17 @@ def main():
         if len(sys.argv) > 1:
             text = " ".join(sys.argv[1:])  # Join all arguments as text
         else:
-            # Default completion messages
-            completion_messages = [
-                "Work complete!",
-                "All done!",
-                "Task finished!",
-                "Job complete!",
-                "Ready for next task!"
-            ]
-            text = random.choice(completion_messages)
+            text = COMPLETION_MESSAGES[random.randrange(len(COMPLETION_MESSAGES))]
         
         print(f"🎯 Text: {text}")
         print("🔊 Speaking...")
         
-        # Speak the text
+        if speak_via_daemon(text):
+            print("✅ Sent to speaker daemon!")
+            return
+        
+        # Fall back to speaking in this process
+        engine = create_engine()
         engine.say(text)
         engine.runAndWait()
         